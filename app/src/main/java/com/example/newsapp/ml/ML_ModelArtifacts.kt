@@ -170,17 +170,26 @@ data class ML_ModelArtifacts(
         /**
          * Parse from Firestore document data (from Python training notebook)
          * 
+         * userFactors / articleFactors are stored as chunked subcollections of
+         * the model document and merged into this map by ML_ModelDownloader.
+         * 
          * Expected structure:
          * {
          *   "version": "v20251206_181659",
          *   "createdAt": "2025-12-06T18:16:59",
          *   "algorithmType": "collaborative_filtering_svd",
          *   "nComponents": 1,
+         *   "factorEncoding": "base64",
+         *   "factorDtype": "float32",
+         *   "factorDim": 1,
          *   "trainingStats": {...},
          *   "categoryWeights": [...],
-         *   "userFactors": [{"userId": "...", "factors": [...]}, ...],
-         *   "articleFactors": [{"articleId": "...", "factors": [...]}, ...]
+         *   "userFactors": [{"userId": "...", "factors": "<base64>"}, ...],
+         *   "articleFactors": [{"articleId": "...", "factors": "<base64>"}, ...]
          * }
+         * 
+         * factors is base64 of little-endian float32 bytes; plain number lists
+         * from older models are still accepted.
          */
         fun fromFirestore(data: Map<String, Any>?): ML_ModelArtifacts? {
             if (data == null) return null
@@ -202,13 +211,7 @@ data class ML_ModelArtifacts(
                 val userEmbeddings = mutableMapOf<String, List<Float>>()
                 for (userFactor in userFactorsList) {
                     val userId = userFactor["userId"] as? String ?: continue
-                    val factors = userFactor["factors"] as? List<*>
-                    val floatFactors = factors?.mapNotNull { 
-                        when (it) {
-                            is Number -> it.toFloat()
-                            else -> null
-                        }
-                    } ?: continue
+                    val floatFactors = parseFactors(userFactor["factors"]) ?: continue
                     userEmbeddings[userId] = floatFactors
                 }
                 
@@ -217,13 +220,7 @@ data class ML_ModelArtifacts(
                 val articleEmbeddings = mutableMapOf<String, List<Float>>()
                 for (articleFactor in articleFactorsList) {
                     val articleId = articleFactor["articleId"] as? String ?: continue
-                    val factors = articleFactor["factors"] as? List<*>
-                    val floatFactors = factors?.mapNotNull {
-                        when (it) {
-                            is Number -> it.toFloat()
-                            else -> null
-                        }
-                    } ?: continue
+                    val floatFactors = parseFactors(articleFactor["factors"]) ?: continue
                     articleEmbeddings[articleId] = floatFactors
                 }
                 
@@ -257,6 +254,23 @@ data class ML_ModelArtifacts(
             }
         }
         
+        /**
+         * Decode a factor vector: base64 float32 (little-endian) string or list of numbers
+         */
+        private fun parseFactors(value: Any?): List<Float>? {
+            return when (value) {
+                is String -> {
+                    val bytes = android.util.Base64.decode(value, android.util.Base64.DEFAULT)
+                    val buffer = java.nio.ByteBuffer.wrap(bytes)
+                        .order(java.nio.ByteOrder.LITTLE_ENDIAN)
+                        .asFloatBuffer()
+                    List(buffer.remaining()) { buffer.get(it) }
+                }
+                is List<*> -> value.mapNotNull { (it as? Number)?.toFloat() }
+                else -> null
+            }
+        }
+        
         /**
          * Create empty/default model (for cold start)
          */
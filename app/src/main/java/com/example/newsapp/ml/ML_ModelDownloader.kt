@@ -68,7 +68,33 @@ class ML_ModelDownloader @Inject constructor(
             android.util.Log.d(TAG, "Model fetched from Firestore")
             
             // Parse model data
-            val model = ML_ModelArtifacts.fromFirestore(modelDoc.data)
+            val headerData = modelDoc.data.orEmpty()
+            val modelData = if (headerData["factorLayout"] == FACTOR_LAYOUT_CHUNKED) {
+                // Factors live in subcollections, chunked into blob documents
+                val version = modelDoc.getString("version")
+                val userFactors = fetchFactors(USER_FACTORS_COLLECTION, "userId", version)
+                val articleFactors = fetchFactors(ARTICLE_FACTORS_COLLECTION, "articleId", version)
+                
+                android.util.Log.d(TAG, "Factors fetched: users=${userFactors.size}, articles=${articleFactors.size}")
+                
+                // Don't cache a partial model (e.g. factors replaced mid-download)
+                val trainingStats = headerData["trainingStats"] as? Map<*, *>
+                val expectedUsers = (trainingStats?.get("totalUsers") as? Number)?.toInt()
+                val expectedArticles = (trainingStats?.get("totalArticles") as? Number)?.toInt()
+                if (userFactors.size != expectedUsers || articleFactors.size != expectedArticles) {
+                    android.util.Log.e(TAG, "Incomplete model factors: expected users=$expectedUsers, articles=$expectedArticles")
+                    return Result.failure(Exception("Incomplete model factors"))
+                }
+                
+                headerData + mapOf(
+                    "userFactors" to userFactors,
+                    "articleFactors" to articleFactors
+                )
+            } else {
+                // Older / notebook-uploaded models keep factors inline in the header
+                headerData
+            }
+            val model = ML_ModelArtifacts.fromFirestore(modelData)
             
             if (model == null) {
                 android.util.Log.e(TAG, "Failed to parse model from Firestore")
@@ -120,6 +146,41 @@ class ML_ModelDownloader @Inject constructor(
         }
     }
     
+    /**
+     * Fetch factor rows of the given model version from a subcollection
+     * of the model document
+     * 
+     * Each chunk document has a "payload" blob holding JSON
+     * {"ids": [...], "factors": [...]}; rows are returned as
+     * {idField: id, "factors": encodedRow} maps for ML_ModelArtifacts.fromFirestore.
+     */
+    private suspend fun fetchFactors(
+        collection: String,
+        idField: String,
+        version: String?
+    ): List<Map<String, Any>> {
+        val factorsRef = firestore.collection(MODEL_COLLECTION)
+            .document(MODEL_DOCUMENT_ID)
+            .collection(collection)
+        
+        // Chunk IDs are per version and the trainer deletes old versions only after
+        // switching the header, so other versions may coexist; only take the current one
+        val query = if (version != null) factorsRef.whereEqualTo("version", version) else factorsRef
+        
+        val rows = mutableListOf<Map<String, Any>>()
+        for (chunk in query.get().await().documents) {
+            val payload = chunk.getBlob("payload")?.toBytes() ?: continue
+            val json = org.json.JSONObject(String(payload, Charsets.UTF_8))
+            val ids = json.getJSONArray("ids")
+            val factors = json.getJSONArray("factors")
+            
+            for (i in 0 until minOf(ids.length(), factors.length())) {
+                rows.add(mapOf(idField to ids.getString(i), "factors" to factors.getString(i)))
+            }
+        }
+        return rows
+    }
+    
     /**
      * Load model from local cache
      */
@@ -227,6 +288,9 @@ class ML_ModelDownloader @Inject constructor(
         // Firestore collection and document
         private const val MODEL_COLLECTION = "ml_models"
         private const val MODEL_DOCUMENT_ID = "recommendation_model_v1"
+        private const val USER_FACTORS_COLLECTION = "userFactors"
+        private const val ARTICLE_FACTORS_COLLECTION = "articleFactors"
+        private const val FACTOR_LAYOUT_CHUNKED = "chunked"
         
         // Local cache
         private const val MODEL_CACHE_DIR = "ml_models"
@@ -7,10 +7,11 @@ This script trains an SVD-based recommendation model using user interaction data
 from Firestore, then uploads the trained model back to Firestore for distribution.
 
 Usage:
-    python train_model.py
+    python train_model.py [--force]
 
 Environment Variables:
     FIREBASE_SERVICE_ACCOUNT_JSON: Base64-encoded Firebase service account JSON
+    FORCE_TRAIN: "true" to retrain even if the data is unchanged (same as --force)
 
 Author: NewsApp Team
 """
@@ -19,14 +20,19 @@ import os
 import sys
 import json
 import base64
-import tempfile
+import hashlib
+import itertools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 
 import numpy as np
+import orjson
 import pandas as pd
-from sklearn.decomposition import TruncatedSVD
-from tqdm import tqdm
+from scipy import sparse
+from sklearn.utils.extmath import randomized_svd
 
 import firebase_admin
 from firebase_admin import credentials, firestore
@@ -43,12 +49,27 @@ MIN_INTERACTIONS = 3
 # SVD parameters
 N_COMPONENTS = 10  # Embedding dimension
 
+# Factor serialization (base64 of little-endian float32 bytes, ~4x smaller than float lists)
+FACTOR_ENCODING = "base64"
+FACTOR_DTYPE = "float32"
+FACTOR_CHUNK_ROWS = 2000  # ~200 KB per chunk document at 10 components
+MODEL_FORMAT_VERSION = 2  # Bump when training or upload format changes (invalidates dataHash)
+FACTOR_LAYOUT = "chunked"  # Factors in subcollections; the app falls back to inline lists without it
+
 # Firestore collections
 COLLECTION_INTERACTIONS = "user_interactions"
 COLLECTION_PREFERENCES = "user_preferences"
 COLLECTION_BOOKMARKS = "user_bookmarks"
 COLLECTION_ML_MODELS = "ml_models"
 MODEL_DOCUMENT_ID = "recommendation_model_v1"
+SUBCOLLECTION_USER_FACTORS = "userFactors"
+SUBCOLLECTION_ARTICLE_FACTORS = "articleFactors"
+
+# Batched Firestore writes (a WriteBatch holds at most 500 operations)
+UPLOAD_BATCH_SIZE = 450
+UPLOAD_BATCH_MAX_BYTES = 8 * 1024 * 1024  # Stay under the 10 MiB request limit
+UPLOAD_MAX_WORKERS = 10
+UPLOAD_MAX_WRITES_PER_SECOND = 10000
 
 
 # ============================================================================
@@ -84,15 +105,8 @@ def init_firebase():
         creds_json = base64.b64decode(creds_base64).decode("utf-8")
         creds_dict = json.loads(creds_json)
         
-        # Write to temp file (firebase-admin requires file path)
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(creds_dict, f)
-            temp_creds_path = f.name
-        
-        cred = credentials.Certificate(temp_creds_path)
-        
-        # Clean up temp file after init
-        os.unlink(temp_creds_path)
+        # firebase-admin accepts the parsed dict directly, no temp file needed
+        cred = credentials.Certificate(creds_dict)
     
     firebase_admin.initialize_app(cred, {
         "storageBucket": "newsapp-fae0d.appspot.com"
@@ -107,28 +121,41 @@ def init_firebase():
 # ============================================================================
 
 def fetch_user_interactions(db):
-    """Fetch all user interactions from Firestore."""
+    """Fetch all user interactions from Firestore as parallel columns."""
     print("📡 Fetching user interactions...")
     
-    interactions = []
-    users_ref = db.collection(COLLECTION_INTERACTIONS)
-    
-    for user_doc in users_ref.list_documents():
-        user_id = user_doc.id
-        articles_ref = user_doc.collection("articles")
+    user_ids = []
+    article_ids = []
+    click_counts = []
+    time_spent = []
+    is_bookmarked = []
+    categories = []
+    
+    # Single collection-group query instead of one stream() per user;
+    # the owning user is the parent of the "articles" subcollection
+    for article_doc in db.collection_group("articles").stream():
+        user_ref = article_doc.reference.parent.parent
+        if user_ref is None or user_ref.parent.id != COLLECTION_INTERACTIONS:
+            continue
         
-        for article_doc in articles_ref.stream():
-            data = article_doc.to_dict()
-            interactions.append({
-                "user_id": user_id,
-                "article_id": article_doc.id,
-                "click_count": data.get("clickCount", 0),
-                "time_spent": data.get("timeSpentReading", 0),
-                "is_bookmarked": data.get("isBookmarked", False),
-                "category": data.get("category", "unknown")
-            })
+        data = article_doc.to_dict()
+        user_ids.append(user_ref.id)
+        article_ids.append(article_doc.id)
+        click_counts.append(data.get("clickCount", 0))
+        time_spent.append(data.get("timeSpentReading", 0))
+        is_bookmarked.append(bool(data.get("isBookmarked", False)))
+        categories.append(data.get("category", "unknown"))
+    
+    interactions = {
+        "user_id": user_ids,
+        "article_id": article_ids,
+        "click_count": np.asarray(click_counts, dtype=np.int32),
+        "time_spent": np.asarray(time_spent, dtype=np.float32),
+        "is_bookmarked": np.asarray(is_bookmarked, dtype=np.uint8),
+        "category": categories
+    }
     
-    print(f"✅ Fetched {len(interactions)} interactions")
+    print(f"✅ Fetched {len(user_ids)} interactions")
     return interactions
 
 
@@ -138,16 +165,17 @@ def fetch_user_preferences(db):
     
     preferences = []
     users_ref = db.collection(COLLECTION_PREFERENCES)
+    refs = [
+        user_doc.collection("ml_data").document("preferences")
+        for user_doc in users_ref.list_documents()
+    ]
     
-    for user_doc in users_ref.list_documents():
-        user_id = user_doc.id
-        ml_data_ref = user_doc.collection("ml_data").document("preferences")
-        ml_data = ml_data_ref.get()
-        
+    # get_all() batches every document read into one streaming RPC
+    for ml_data in db.get_all(refs):
         if ml_data.exists:
             data = ml_data.to_dict()
             preferences.append({
-                "user_id": user_id,
+                "user_id": ml_data.reference.parent.parent.id,
                 "category_scores": data.get("categoryScores", {}),
                 "total_interactions": data.get("totalInteractions", 0)
             })
@@ -157,25 +185,30 @@ def fetch_user_preferences(db):
 
 
 def fetch_bookmarks(db):
-    """Fetch user bookmarks from Firestore."""
+    """Fetch user bookmarks from Firestore as parallel columns."""
     print("📡 Fetching user bookmarks...")
     
-    bookmarks = []
-    users_ref = db.collection(COLLECTION_BOOKMARKS)
+    user_ids = []
+    article_ids = []
+    categories = []
     
-    for user_doc in users_ref.list_documents():
-        user_id = user_doc.id
-        bookmarks_ref = user_doc.collection("bookmarks")
+    for bookmark_doc in db.collection_group("bookmarks").stream():
+        user_ref = bookmark_doc.reference.parent.parent
+        if user_ref is None or user_ref.parent.id != COLLECTION_BOOKMARKS:
+            continue
         
-        for bookmark_doc in bookmarks_ref.stream():
-            data = bookmark_doc.to_dict()
-            bookmarks.append({
-                "user_id": user_id,
-                "article_id": bookmark_doc.id,
-                "category": data.get("category", "unknown")
-            })
+        data = bookmark_doc.to_dict()
+        user_ids.append(user_ref.id)
+        article_ids.append(bookmark_doc.id)
+        categories.append(data.get("category", "unknown"))
+    
+    bookmarks = {
+        "user_id": user_ids,
+        "article_id": article_ids,
+        "category": categories
+    }
     
-    print(f"✅ Fetched {len(bookmarks)} bookmarks")
+    print(f"✅ Fetched {len(user_ids)} bookmarks")
     return bookmarks
 
 
@@ -184,74 +217,109 @@ def fetch_bookmarks(db):
 # ============================================================================
 
 def build_interaction_matrix(interactions, bookmarks):
-    """Build user-article interaction matrix for SVD training."""
+    """Build sparse (CSR) user-article interaction matrix; returns (matrix, user_ids, article_ids)."""
     print("🔧 Building interaction matrix...")
     
-    # Combine interactions and bookmarks into scores
-    scores = {}
-    
-    for interaction in interactions:
-        user_id = interaction["user_id"]
-        article_id = interaction["article_id"]
-        
-        # Score formula: clicks + bookmark*5 + reading_time/30
-        score = (
-            interaction["click_count"] +
-            (5 if interaction["is_bookmarked"] else 0) +
-            interaction["time_spent"] / 30.0
-        )
-        
-        key = (user_id, article_id)
-        scores[key] = scores.get(key, 0) + score
+    # Score formula: clicks + bookmark*5 + reading_time/30
+    interaction_scores = (
+        interactions["click_count"].astype(np.float32) +
+        5.0 * interactions["is_bookmarked"] +
+        interactions["time_spent"] / 30.0
+    )
     
-    # Add bookmarks with extra weight
-    for bookmark in bookmarks:
-        key = (bookmark["user_id"], bookmark["article_id"])
-        scores[key] = scores.get(key, 0) + 5
+    n_interactions = len(interaction_scores)
+    user_col = interactions["user_id"] + bookmarks["user_id"]
+    article_col = interactions["article_id"] + bookmarks["article_id"]
     
-    if not scores:
+    if not user_col:
         print("⚠️ No interaction data found!")
         return None, None, None
     
-    # Create DataFrame
-    df = pd.DataFrame([
-        {"user_id": k[0], "article_id": k[1], "score": v}
-        for k, v in scores.items()
-    ])
-    
-    # Pivot to matrix
-    matrix = df.pivot_table(
-        index="user_id",
-        columns="article_id",
-        values="score",
-        fill_value=0
+    # Map ids to contiguous integer codes (shared by interactions and bookmarks)
+    user_ids, user_codes = np.unique(np.asarray(user_col), return_inverse=True)
+    article_ids, article_codes = np.unique(np.asarray(article_col), return_inverse=True)
+    shape = (len(user_ids), len(article_ids))
+    
+    # Sparse float32 matrix: only observed (user, article) pairs are stored,
+    # duplicate pairs are summed in C by sum_duplicates()
+    interaction_matrix = sparse.coo_matrix(
+        (interaction_scores, (user_codes[:n_interactions], article_codes[:n_interactions])),
+        shape=shape,
+        dtype=np.float32
     )
+    interaction_matrix.sum_duplicates()
+    
+    # Add bookmarks with extra weight
+    bookmark_matrix = sparse.coo_matrix(
+        (
+            np.full(len(bookmarks["user_id"]), 5.0, dtype=np.float32),
+            (user_codes[n_interactions:], article_codes[n_interactions:])
+        ),
+        shape=shape,
+        dtype=np.float32
+    )
+    
+    matrix = (interaction_matrix + bookmark_matrix).tocsr()
+    
+    print(f"✅ Matrix shape: {matrix.shape} (users × articles), {matrix.nnz} non-zero")
     
-    print(f"✅ Matrix shape: {matrix.shape} (users × articles)")
+    return matrix, user_ids.tolist(), article_ids.tolist()
+
+
+def compute_data_hash(matrix, user_ids, article_ids, preferences):
+    """Content hash of the training inputs and model format, used to skip retraining on unchanged data."""
+    matrix.sort_indices()
     
-    return matrix, list(matrix.index), list(matrix.columns)
+    h = hashlib.blake2b(digest_size=32)
+    h.update(orjson.dumps([
+        MODEL_FORMAT_VERSION, N_COMPONENTS, FACTOR_LAYOUT,
+        FACTOR_ENCODING, FACTOR_DTYPE, FACTOR_CHUNK_ROWS
+    ]))
+    h.update(orjson.dumps(
+        sorted(
+            ([pref["user_id"], pref.get("category_scores", {})] for pref in preferences),
+            key=lambda item: item[0]
+        ),
+        option=orjson.OPT_SORT_KEYS
+    ))
+    h.update("\0".join(user_ids).encode("utf-8"))
+    h.update(b"\1")
+    h.update("\0".join(article_ids).encode("utf-8"))
+    h.update(matrix.data.tobytes())
+    h.update(matrix.indices.tobytes())
+    h.update(matrix.indptr.tobytes())
+    return h.hexdigest()
 
 
 # ============================================================================
 # Model Training
 # ============================================================================
 
-def train_svd_model(matrix, n_components=N_COMPONENTS):
-    """Train SVD model on interaction matrix."""
+def train_svd_model(matrix_csr, n_components=N_COMPONENTS):
+    """Train SVD model on sparse (CSR) interaction matrix."""
     print(f"🧠 Training SVD model (n_components={n_components})...")
     
     # Ensure we don't have more components than features
-    n_components = min(n_components, min(matrix.shape) - 1)
+    n_components = min(n_components, min(matrix_csr.shape) - 1)
     if n_components < 1:
         n_components = 1
     
-    svd = TruncatedSVD(n_components=n_components, random_state=42)
+    # Randomized SVD with oversampling; cost O(mn log k) on the sparse matrix
+    U, S, Vt = randomized_svd(
+        matrix_csr,
+        n_components=n_components,
+        n_oversamples=10,
+        n_iter=2,
+        power_iteration_normalizer="QR",
+        random_state=42
+    )
     
-    # Fit and transform
-    user_factors = svd.fit_transform(matrix.values)
-    article_factors = svd.components_.T
+    user_factors = (U * S).astype(np.float32, copy=False)
+    article_factors = Vt.T.astype(np.float32, copy=False)
     
-    explained_variance = svd.explained_variance_ratio_.sum()
+    # Share of the squared Frobenius norm captured by the rank-k approximation
+    total_energy = matrix_csr.multiply(matrix_csr).sum()
+    explained_variance = (S ** 2).sum() / total_energy if total_energy > 0 else 0.0
     print(f"✅ SVD trained! Explained variance: {explained_variance:.2%}")
     
     return user_factors, article_factors, n_components
@@ -261,7 +329,14 @@ def train_svd_model(matrix, n_components=N_COMPONENTS):
 # Model Export
 # ============================================================================
 
-def build_model_artifacts(user_ids, article_ids, user_factors, article_factors, n_components, preferences):
+def encode_factors(factors):
+    """Encode each factor row as base64 of its little-endian float32 bytes."""
+    rows = np.ascontiguousarray(factors, dtype="<f4")
+    return [base64.b64encode(row.tobytes()).decode("ascii") for row in rows]
+
+
+def build_model_artifacts(user_ids, article_ids, user_factors, article_factors, n_components, preferences,
+                          total_interactions, data_hash):
     """Build model artifacts for Android app consumption."""
     print("📦 Building model artifacts...")
     
@@ -270,36 +345,25 @@ def build_model_artifacts(user_ids, article_ids, user_factors, article_factors,
     version = f"v{now.strftime('%Y%m%d_%H%M%S')}"
     created_at = now.isoformat()
     
-    # Build user factors list
-    user_factors_list = []
-    for i, user_id in enumerate(user_ids):
-        user_factors_list.append({
-            "userId": user_id,
-            "factors": user_factors[i].tolist()
-        })
-    
-    # Build article factors list
-    article_factors_list = []
-    for i, article_id in enumerate(article_ids):
-        article_factors_list.append({
-            "articleId": article_id,
-            "factors": article_factors[i].tolist()
-        })
-    
-    # Build category weights from preferences
-    category_weights = {}
-    for pref in preferences:
-        for category, score in pref.get("category_scores", {}).items():
-            category_weights[category] = category_weights.get(category, 0) + score
+    # Factor rows are kept as flat id / encoded-row columns, no per-row dicts
+    user_factors_list = encode_factors(user_factors)
+    article_factors_list = encode_factors(article_factors)
+    
+    # Build category weights from preferences: one groupby over all (category, score) pairs
+    category_scores = pd.DataFrame(
+        list(itertools.chain.from_iterable(
+            pref.get("category_scores", {}).items() for pref in preferences
+        )),
+        columns=["category", "score"]
+    )
+    category_weights = category_scores.groupby("category")["score"].sum()
     
     # Normalize category weights
-    if category_weights:
-        max_weight = max(category_weights.values())
-        if max_weight > 0:
-            category_weights = {k: v / max_weight for k, v in category_weights.items()}
+    if not category_weights.empty and category_weights.max() > 0:
+        category_weights /= category_weights.max()
     
     category_weights_list = [
-        {"category": k, "weight": v}
+        {"category": k, "weight": float(v)}
         for k, v in category_weights.items()
     ]
     
@@ -309,13 +373,20 @@ def build_model_artifacts(user_ids, article_ids, user_factors, article_factors,
         "createdAt": created_at,
         "algorithmType": "collaborative_filtering_svd",
         "nComponents": n_components,
+        "factorLayout": FACTOR_LAYOUT,
+        "factorEncoding": FACTOR_ENCODING,
+        "factorDtype": FACTOR_DTYPE,
+        "factorDim": n_components,
+        "dataHash": data_hash,
         "trainingStats": {
             "totalUsers": len(user_ids),
             "totalArticles": len(article_ids),
-            "totalInteractions": sum(len(uf) for uf in user_factors)
+            "totalInteractions": total_interactions
         },
         "categoryWeights": category_weights_list,
+        "userIds": list(user_ids),
         "userFactors": user_factors_list,
+        "articleIds": list(article_ids),
         "articleFactors": article_factors_list
     }
     
@@ -324,12 +395,130 @@ def build_model_artifacts(user_ids, article_ids, user_factors, article_factors,
     return model_doc, version
 
 
+class RateLimiter:
+    """Thread-safe token bucket capping Firestore writes per second."""
+    
+    def __init__(self, rate):
+        self.rate = rate
+        self.tokens = float(rate)
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def acquire(self, n):
+        """Block until n write tokens are available."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.rate, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+                
+                if self.tokens >= n:
+                    self.tokens -= n
+                    return
+                
+                wait = (n - self.tokens) / self.rate
+            
+            time.sleep(wait)
+
+
+def upload_factors(db, collection_ref, ids, factors, version, rate_limiter):
+    """Write factor rows as per-version orjson blob chunks, using parallel batched commits."""
+    docs = [
+        (
+            collection_ref.document(f"{version}_chunk_{i // FACTOR_CHUNK_ROWS:05d}"),
+            {
+                "version": version,
+                "payload": orjson.dumps({
+                    "ids": ids[i:i + FACTOR_CHUNK_ROWS],
+                    "factors": factors[i:i + FACTOR_CHUNK_ROWS]
+                })
+            }
+        )
+        for i in range(0, len(ids), FACTOR_CHUNK_ROWS)
+    ]
+    
+    # Group chunk documents into batches under the operation and request size limits
+    batches = []
+    batch_size = 0
+    for doc in docs:
+        doc_size = len(doc[1]["payload"])
+        if not batches or len(batches[-1]) >= UPLOAD_BATCH_SIZE or batch_size + doc_size > UPLOAD_BATCH_MAX_BYTES:
+            batches.append([])
+            batch_size = 0
+        batches[-1].append(doc)
+        batch_size += doc_size
+    
+    def commit_batch(batch_docs):
+        batch = db.batch()
+        for doc_ref, data in batch_docs:
+            batch.set(doc_ref, data)
+        
+        rate_limiter.acquire(len(batch_docs))
+        batch.commit()
+        return len(batch_docs)
+    
+    written = 0
+    with ThreadPoolExecutor(max_workers=UPLOAD_MAX_WORKERS) as executor:
+        futures = [executor.submit(commit_batch, batch_docs) for batch_docs in batches]
+        for future in as_completed(futures):
+            written += future.result()
+    
+    return written
+
+
+def delete_stale_factors(db, collection_ref, version):
+    """Delete factor chunks of every version other than the given one."""
+    stale_refs = [
+        doc.reference
+        for doc in collection_ref.select(["version"]).stream()
+        if doc.get("version") != version
+    ]
+    
+    for i in range(0, len(stale_refs), UPLOAD_BATCH_SIZE):
+        batch = db.batch()
+        for ref in stale_refs[i:i + UPLOAD_BATCH_SIZE]:
+            batch.delete(ref)
+        batch.commit()
+    
+    return len(stale_refs)
+
+
+def fetch_previous_data_hash(db):
+    """Get the data hash stored with the currently published model, if any."""
+    doc = db.collection(COLLECTION_ML_MODELS).document(MODEL_DOCUMENT_ID).get()
+    return doc.to_dict().get("dataHash") if doc.exists else None
+
+
 def upload_model_to_firestore(db, model_doc, version):
     """Upload trained model to Firestore."""
     print(f"☁️ Uploading model {version} to Firestore...")
     
     doc_ref = db.collection(COLLECTION_ML_MODELS).document(MODEL_DOCUMENT_ID)
-    doc_ref.set(model_doc)
+    header = {
+        k: v for k, v in model_doc.items()
+        if k not in ("userIds", "userFactors", "articleIds", "articleFactors")
+    }
+    rate_limiter = RateLimiter(UPLOAD_MAX_WRITES_PER_SECOND)
+    
+    n_users = upload_factors(
+        db, doc_ref.collection(SUBCOLLECTION_USER_FACTORS),
+        model_doc["userIds"], model_doc["userFactors"], version, rate_limiter
+    )
+    n_articles = upload_factors(
+        db, doc_ref.collection(SUBCOLLECTION_ARTICLE_FACTORS),
+        model_doc["articleIds"], model_doc["articleFactors"], version, rate_limiter
+    )
+    print(f"✅ Uploaded {n_users} user factor chunks, {n_articles} article factor chunks")
+    
+    # Switch the header only after the new version's factors exist,
+    # then drop factor chunks of older versions
+    doc_ref.set(header)
+    
+    n_stale = sum(
+        delete_stale_factors(db, doc_ref.collection(collection), version)
+        for collection in (SUBCOLLECTION_USER_FACTORS, SUBCOLLECTION_ARTICLE_FACTORS)
+    )
+    print(f"🧹 Deleted {n_stale} factor chunks from previous versions")
     
     print(f"✅ Model uploaded to: {COLLECTION_ML_MODELS}/{MODEL_DOCUMENT_ID}")
     return True
@@ -339,8 +528,16 @@ def upload_model_to_firestore(db, model_doc, version):
 # Main Training Pipeline
 # ============================================================================
 
+def is_force_train():
+    """Whether training was forced via --force or the FORCE_TRAIN env var."""
+    env_value = os.environ.get("FORCE_TRAIN", "").strip().lower()
+    return "--force" in sys.argv[1:] or env_value in ("1", "true", "yes")
+
+
 def main():
     """Main training pipeline."""
+    force_train = is_force_train()
+    
     print("=" * 60)
     print("🚀 NewsApp ML Training Pipeline")
     print("=" * 60)
@@ -350,20 +547,26 @@ def main():
         # Initialize Firebase
         db = init_firebase()
         
-        # Fetch data
-        interactions = fetch_user_interactions(db)
-        preferences = fetch_user_preferences(db)
-        bookmarks = fetch_bookmarks(db)
+        # Fetch data (independent collections, fetched concurrently)
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            interactions_future = executor.submit(fetch_user_interactions, db)
+            preferences_future = executor.submit(fetch_user_preferences, db)
+            bookmarks_future = executor.submit(fetch_bookmarks, db)
+            
+            interactions = interactions_future.result()
+            preferences = preferences_future.result()
+            bookmarks = bookmarks_future.result()
         
         # Check minimum requirements
-        user_ids = set(i["user_id"] for i in interactions)
+        user_ids = set(interactions["user_id"])
         if len(user_ids) < MIN_USERS:
             print(f"⚠️ Not enough users for training: {len(user_ids)} < {MIN_USERS}")
             print("⏭️ Skipping training. App will use rule-based recommendations.")
             return 0
         
-        if len(interactions) < MIN_INTERACTIONS:
-            print(f"⚠️ Not enough interactions for training: {len(interactions)} < {MIN_INTERACTIONS}")
+        n_interactions = len(interactions["user_id"])
+        if n_interactions < MIN_INTERACTIONS:
+            print(f"⚠️ Not enough interactions for training: {n_interactions} < {MIN_INTERACTIONS}")
             print("⏭️ Skipping training. App will use rule-based recommendations.")
             return 0
         
@@ -374,6 +577,15 @@ def main():
             print("❌ Failed to build interaction matrix")
             return 1
         
+        # Skip training if the data hasn't changed since the published model
+        data_hash = compute_data_hash(matrix, user_ids, article_ids, preferences)
+        if force_train:
+            print("⚠️ Force training enabled: skipping unchanged-data check")
+        elif data_hash == fetch_previous_data_hash(db):
+            print("✅ No changes in training data since last training")
+            print("⏭️ Skipping training. Published model is up to date.")
+            return 0
+        
         # Train SVD model
         user_factors, article_factors, n_components = train_svd_model(matrix)
         
@@ -381,7 +593,9 @@ def main():
         model_doc, version = build_model_artifacts(
             user_ids, article_ids,
             user_factors, article_factors,
-            n_components, preferences
+            n_components, preferences,
+            total_interactions=matrix.nnz,
+            data_hash=data_hash
         )
         
         # Upload to Firestore